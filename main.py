@@ -1,8 +1,23 @@
 import asyncio
+import dataclasses
+import functools
+import hashlib
 import os
 import json
+import time
+from collections import OrderedDict
 import yaml
-from kubernetes import client, config, utils
+try:
+    from yaml import CSafeLoader as _SafeLoader # LibYAML-backed loader, much faster on large manifests
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from kubernetes_asyncio import client, config, utils
+from kubernetes_asyncio.client.rest import RESTResponse
+from kubernetes_asyncio.dynamic import DynamicClient
 from mcp.server import Server, NotificationOptions
 from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
@@ -11,20 +26,181 @@ import mcp.types as types
 # -----------------------------
 # Kubernetes initialization
 # -----------------------------
-def load_kube_config_once():
+async def load_kube_config_once(configuration):
     """
-    Load Kubernetes configuration from ~/.kube/config
+    Load Kubernetes configuration into the given client configuration.
+    Uses the pod's service account when running inside a cluster, ~/.kube/config otherwise.
     """
+    if os.getenv("KUBERNETES_SERVICE_HOST"):
+        try:
+            config.load_incluster_config(client_configuration=configuration)
+            print("Loaded in-cluster config from service account", flush=True)
+            return
+        except Exception as e:
+            raise Exception(f"Failed to load in-cluster kubernetes config. Error: {e}")
+
     try:
-        config.load_kube_config()
+        await config.load_kube_config(client_configuration=configuration)
         print("Loaded kubeconfig from ~/.kube/config", flush=True)
     except Exception as e:
         raise Exception(f"Failed to load kubernetes config from ~/.kube/config. Error: {e}")
 
-load_kube_config_once()
-v1 = client.CoreV1Api() # Core V1 API client to deal with (pods, services, nodes, namespaces, etc.)
-apps_v1 = client.AppsV1Api() # Apps V1 API client to deal with (deployments, statefulsets, etc.)
-api_client = client.ApiClient() # Generic API client (create_from_yaml, etc.)
+# API clients are created in init() once the config has been loaded inside the event loop
+v1 = None # Core V1 API client to deal with (pods, services, nodes, namespaces, etc.)
+apps_v1 = None # Apps V1 API client to deal with (deployments, statefulsets, etc.)
+api_client = None # Generic API client (create_from_dict, etc.), shared by the typed clients above
+dyn_client = None # Dynamic client resolving any apiVersion/kind through cached API discovery, see get_dyn_client()
+_dyn_client_lock = asyncio.Lock()
+
+async def init():
+    """
+    Load the kubeconfig and create the async API clients
+    """
+    global v1, apps_v1, api_client
+    configuration = client.Configuration()
+    await load_kube_config_once(configuration)
+    # One ApiClient means one HTTP session, so every call reuses the same pooled TLS connections
+    # (kubernetes_asyncio's default pool allows 100 parallel connections)
+    api_client = client.ApiClient(configuration=configuration)
+    v1 = client.CoreV1Api(api_client)
+    apps_v1 = client.AppsV1Api(api_client)
+    _build_get_tables()
+
+async def get_dyn_client():
+    """
+    Create the dynamic client on first use. Creating it runs API discovery, which only
+    kubectl_delete needs, so startup doesn't depend on the API server being reachable.
+    """
+    global dyn_client
+    async with _dyn_client_lock:
+        if dyn_client is None:
+            dyn_client = await DynamicClient(api_client)
+    return dyn_client
+
+# -----------------------------
+# Read cache
+# -----------------------------
+CACHE_TTL_SECONDS = 2 # Collapses get-then-describe bursts and tight polling loops
+CACHE_MAXSIZE = 512
+
+_cache = OrderedDict() # (fn name, namespace, generation, kwargs) -> (expires_at, value), least recently used first
+_inflight = {} # Same keys -> task of a fetch still in progress, shared by concurrent identical calls
+_cache_generations = {} # namespace (None for cluster-scoped) -> generation, bumped on every write
+
+def _purge_expired(cache, now):
+    for key in [key for key, (expires_at, _) in cache.items() if expires_at <= now]:
+        del cache[key]
+
+def _store_result(key, task):
+    del _inflight[key]
+    if task.cancelled() or task.exception() is not None:
+        return
+    now = time.monotonic()
+    _purge_expired(_cache, now)
+    _cache[key] = (now + CACHE_TTL_SECONDS, task.result())
+    _cache.move_to_end(key)
+    if len(_cache) > CACHE_MAXSIZE:
+        _cache.popitem(last=False)
+
+async def _cached_call(fn, **kwargs):
+    """
+    Call a read_*/list_* API function, reusing a result fetched less than CACHE_TTL_SECONDS ago.
+    Concurrent calls with the same arguments share a single request.
+    """
+    namespace = kwargs.get("namespace")
+    key = (fn.__name__, namespace, _cache_generations.get(namespace, 0), tuple(sorted(kwargs.items())))
+    entry = _cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        _cache.move_to_end(key)
+        return entry[1]
+
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fn(**kwargs))
+        _inflight[key] = task
+        task.add_done_callback(functools.partial(_store_result, key))
+    # Shielded so one caller being cancelled doesn't cancel the fetch the others are waiting on
+    return await asyncio.shield(task)
+
+def _cached(fn):
+    return functools.partial(_cached_call, fn)
+
+def _invalidate_cache(*namespaces):
+    """
+    Drop cached reads for the given namespaces and for cluster-scoped resources
+    """
+    for namespace in {None, *namespaces}:
+        _cache_generations[namespace] = _cache_generations.get(namespace, 0) + 1
+
+# -----------------------------
+# JSON helpers
+# -----------------------------
+def _dumps(obj) -> str:
+    """
+    Serialize a tool result as indented JSON, using orjson when it is installed
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC).decode()
+    return json.dumps(obj, indent=2, default=_json_default)
+
+def _json_default(obj):
+    # orjson encodes dataclasses natively; the stdlib encoder needs them turned into dicts
+    if dataclasses.is_dataclass(obj):
+        return dataclasses.asdict(obj)
+    return str(obj)
+
+def _loads(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+async def _read_json(resp):
+    """
+    Parse a response fetched with _preload_content=False. Such responses skip the client's
+    status check, so raise ApiException for non-2xx here like the preloaded path does.
+    """
+    data = await resp.read()
+    if not 200 <= resp.status <= 299:
+        raise client.ApiException(http_resp=RESTResponse(resp, data.decode("utf-8", "replace")))
+    return _loads(data)
+
+# -----------------------------
+# YAML parsing
+# -----------------------------
+YAML_CACHE_MAXSIZE = 256
+YAML_CACHE_LARGE_THRESHOLD = 64 * 1024 # Bigger manifests are keyed by digest instead of by the string itself
+YAML_CACHE_TTL_SECONDS = 300
+
+_large_yaml_cache = OrderedDict() # blake2b digest -> (expires_at, docs)
+_run = asyncio.to_thread # Runs CPU-heavy work off the event loop
+
+def _load_all(yaml_content: str) -> tuple:
+    return tuple(yaml.load_all(yaml_content, Loader=_SafeLoader))
+
+_parse_small_yaml = functools.lru_cache(maxsize=YAML_CACHE_MAXSIZE)(_load_all)
+
+async def _parse_yaml(yaml_content: str) -> tuple:
+    """
+    Parse all documents of a manifest, reusing the result for manifests seen before.
+    Large manifests are parsed in a worker thread so other tool calls keep running.
+    The returned documents are shared between calls and must not be modified.
+    """
+    if len(yaml_content) <= YAML_CACHE_LARGE_THRESHOLD:
+        return _parse_small_yaml(yaml_content)
+
+    key = hashlib.blake2b(yaml_content.encode(), digest_size=16).digest()
+    now = time.monotonic()
+    entry = _large_yaml_cache.get(key)
+    if entry is not None and entry[0] > now:
+        _large_yaml_cache.move_to_end(key)
+        return entry[1]
+
+    docs = await _run(_load_all, yaml_content)
+    now = time.monotonic()
+    _purge_expired(_large_yaml_cache, now)
+    _large_yaml_cache[key] = (now + YAML_CACHE_TTL_SECONDS, docs)
+    _large_yaml_cache.move_to_end(key)
+    if len(_large_yaml_cache) > YAML_CACHE_MAXSIZE:
+        _large_yaml_cache.popitem(last=False)
+    return docs
 
 # -----------------------------
 # MCP SERVER SETUP
@@ -34,406 +210,595 @@ server = Server("k8s-mcp-server")
 # -----------------------------
 # List tools
 # -----------------------------
-@server.list_tools()
-async def list_tools():
-    return [
-        types.Tool(
-            name="kubectl_apply",
-            description="Apply a Kubernetes manifest from YAML content (kubectl apply -f)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "yaml_content": {
-                        "type": "string",
-                        "description": "YAML manifest content to apply"
-                    },
-                    "namespace": {
-                        "type": "string",
-                        "description": "Namespace to apply the resource in (optional)"
-                    }
+# Tool definitions are constant, so build them once at import time
+_TOOLS = [
+    types.Tool(
+        name="kubectl_apply",
+        description="Apply a Kubernetes manifest from YAML content (kubectl apply -f)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "yaml_content": {
+                    "type": "string",
+                    "description": "YAML manifest content to apply"
                 },
-                "required": ["yaml_content"]
-            }
-        ),
-        types.Tool(
-            name="kubectl_get",
-            description="Get Kubernetes resources (kubectl get)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "resource_type": {
-                        "type": "string",
-                        "description": "Type of resource to get (e.g., pods, deployments, services, nodes, namespaces)"
-                    },
-                    "namespace": {
-                        "type": "string",
-                        "description": "Namespace to get resources from (not applicable for cluster-scoped resources like nodes)"
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "Specific resource name (optional)"
-                    }
+                "namespace": {
+                    "type": "string",
+                    "description": "Namespace to apply the resource in (optional)"
+                }
+            },
+            "required": ["yaml_content"]
+        }
+    ),
+    types.Tool(
+        name="kubectl_get",
+        description="Get Kubernetes resources (kubectl get)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "resource_type": {
+                    "type": "string",
+                    "description": "Type of resource to get (e.g., pods, deployments, services, nodes, namespaces)"
                 },
-                "required": ["resource_type"]
-            }
-        ),
-        types.Tool(
-            name="kubectl_describe",
-            description="Describe a Kubernetes resource (kubectl describe)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "resource_type": {
-                        "type": "string",
-                        "description": "Type of resource to describe (e.g., pod, deployment, service, node)"
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "Name of the resource to describe"
-                    },
-                    "namespace": {
-                        "type": "string",
-                        "description": "Namespace of the resource (not applicable for cluster-scoped resources)"
-                    }
+                "namespace": {
+                    "type": "string",
+                    "description": "Namespace to get resources from (not applicable for cluster-scoped resources like nodes)"
                 },
-                "required": ["resource_type", "name"]
-            }
-        ),
-        types.Tool(
-            name="kubectl_delete",
-            description="Delete a Kubernetes resource from YAML content (kubectl delete -f)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "yaml_content": {
-                        "type": "string",
-                        "description": "YAML manifest content to delete"
-                    },
-                    "namespace": {
-                        "type": "string",
-                        "description": "Namespace to delete the resource from (optional)"
-                    }
+                "name": {
+                    "type": "string",
+                    "description": "Specific resource name (optional, cannot be combined with selectors or names_only)"
                 },
-                "required": ["yaml_content"]
-            }
-        )
-    ]
+                "label_selector": {
+                    "type": "string",
+                    "description": "Only list resources matching this label selector, e.g. app=web (optional)"
+                },
+                "field_selector": {
+                    "type": "string",
+                    "description": "Only list resources matching this field selector, e.g. status.phase=Running (optional)"
+                },
+                "names_only": {
+                    "type": "boolean",
+                    "description": "Return only resource names, fetching metadata instead of full objects from the API server (optional)"
+                }
+            },
+            "required": ["resource_type"]
+        }
+    ),
+    types.Tool(
+        name="kubectl_describe",
+        description="Describe a Kubernetes resource (kubectl describe)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "resource_type": {
+                    "type": "string",
+                    "description": "Type of resource to describe (e.g., pod, deployment, service, node)"
+                },
+                "name": {
+                    "type": "string",
+                    "description": "Name of the resource to describe"
+                },
+                "namespace": {
+                    "type": "string",
+                    "description": "Namespace of the resource (not applicable for cluster-scoped resources)"
+                }
+            },
+            "required": ["resource_type", "name"]
+        }
+    ),
+    types.Tool(
+        name="kubectl_delete",
+        description="Delete a Kubernetes resource from YAML content (kubectl delete -f)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "yaml_content": {
+                    "type": "string",
+                    "description": "YAML manifest content to delete"
+                },
+                "namespace": {
+                    "type": "string",
+                    "description": "Namespace to delete the resource from (optional)"
+                }
+            },
+            "required": ["yaml_content"]
+        }
+    )
+]
+
+@server.list_tools()
+async def list_tools():
+    return _TOOLS
 
 # -----------------------------
 # TOOL IMPLEMENTATIONS
 # -----------------------------
-@server.call_tool()
-async def call_tool(name: str, arguments: dict):
-    if name == "kubectl_apply":
-        yaml_content = arguments.get("yaml_content")
-        if not yaml_content:
-            return [types.TextContent(type="text", text="Error: yaml_content is required")]
-        
-        namespace = arguments.get("namespace")
-        
-        try:
-            docs = list(yaml.safe_load_all(yaml_content))
+async def _handle_apply(arguments: dict):
+    yaml_content = arguments.get("yaml_content")
+    if not yaml_content:
+        return [types.TextContent(type="text", text="Error: yaml_content is required")]
+
+    namespace = arguments.get("namespace")
+
+    try:
+        docs = list(await _parse_yaml(yaml_content))
 
-            utils.create_from_yaml(
-                api_client,
-                yaml_objects=docs,
-                namespace=namespace
-            )
-            
-            resource_name = docs[0].get("metadata", {}).get("name", "unknown")
-            resource_kind = docs[0].get("kind", "unknown")
-            
-            return [types.TextContent(
-                type="text",
-                text=f"Successfully applied {resource_kind}/{resource_name}"
-            )]
-        except Exception as e:
-            return [types.TextContent(type="text", text=f"Error applying manifest: {str(e)}")]
-    
-    if name == "kubectl_get":
-        resource_type = arguments.get("resource_type")
-        if not resource_type:
-            return [types.TextContent(type="text", text="Error: resource_type is required")]
-        
-        resource_type = resource_type.lower()
-        namespace = arguments.get("namespace", "default")
-        name = arguments.get("name")
-        
-        try:
-            result = []
-            
-            if resource_type in ["pod", "pods"]:
-                if name:
-                    pod = v1.read_namespaced_pod(name=name, namespace=namespace)
-                    result.append({
-                        "name": pod.metadata.name,
-                        "namespace": namespace,
-                        "status": pod.status.phase,
-                        "ready": f"{sum(1 for c in (pod.status.container_statuses or []) if c.ready)}/{len(pod.status.container_statuses or [])}",
-                        "restarts": sum(c.restart_count for c in (pod.status.container_statuses or [])),
-                        "node": pod.spec.node_name
-                    })
-                else:
-                    pods = v1.list_namespaced_pod(namespace=namespace)
-                    for p in pods.items:
-                        result.append({
-                            "name": p.metadata.name,
-                            "namespace": namespace,
-                            "status": p.status.phase,
-                            "ready": f"{sum(1 for c in (p.status.container_statuses or []) if c.ready)}/{len(p.status.container_statuses or [])}",
-                            "restarts": sum(c.restart_count for c in (p.status.container_statuses or [])),
-                            "node": p.spec.node_name
-                        })
-            
-            elif resource_type in ["deployment", "deployments"]:
-                if name:
-                    dep = apps_v1.read_namespaced_deployment(name=name, namespace=namespace)
-                    result.append({
-                        "name": dep.metadata.name,
-                        "namespace": namespace,
-                        "ready": f"{dep.status.ready_replicas or 0}/{dep.spec.replicas}",
-                        "up_to_date": dep.status.updated_replicas or 0,
-                        "available": dep.status.available_replicas or 0
-                    })
-                else:
-                    deployments = apps_v1.list_namespaced_deployment(namespace=namespace)
-                    for dep in deployments.items:
-                        result.append({
-                            "name": dep.metadata.name,
-                            "namespace": namespace,
-                            "ready": f"{dep.status.ready_replicas or 0}/{dep.spec.replicas}",
-                            "up_to_date": dep.status.updated_replicas or 0,
-                            "available": dep.status.available_replicas or 0
-                        })
-            
-            elif resource_type in ["service", "services", "svc"]:
-                if name:
-                    svc = v1.read_namespaced_service(name=name, namespace=namespace)
-                    result.append({
-                        "name": svc.metadata.name,
-                        "namespace": namespace,
-                        "type": svc.spec.type,
-                        "cluster_ip": svc.spec.cluster_ip,
-                        "external_ip": svc.spec.external_i_ps or "none",
-                        "ports": [f"{p.port}/{p.protocol}" for p in (svc.spec.ports or [])]
-                    })
-                else:
-                    services = v1.list_namespaced_service(namespace=namespace)
-                    for svc in services.items:
-                        result.append({
-                            "name": svc.metadata.name,
-                            "namespace": namespace,
-                            "type": svc.spec.type,
-                            "cluster_ip": svc.spec.cluster_ip,
-                            "external_ip": svc.spec.external_i_ps or "none",
-                            "ports": [f"{p.port}/{p.protocol}" for p in (svc.spec.ports or [])]
-                        })
-            
-            elif resource_type in ["node", "nodes"]:
-                if name:
-                    node = v1.read_node(name=name)
-                    conditions = {c.type: c.status for c in node.status.conditions}
-                    result.append({
-                        "name": node.metadata.name,
-                        "status": "Ready" if conditions.get("Ready") == "True" else "NotReady",
-                        "roles": [label.split("/")[1] for label in node.metadata.labels.keys() if "node-role.kubernetes.io" in label] or ["<none>"],
-                        "version": node.status.node_info.kubelet_version,
-                        "internal_ip": next((addr.address for addr in node.status.addresses if addr.type == "InternalIP"), "")
-                    })
-                else:
-                    nodes = v1.list_node()
-                    for node in nodes.items:
-                        conditions = {c.type: c.status for c in node.status.conditions}
-                        result.append({
-                            "name": node.metadata.name,
-                            "status": "Ready" if conditions.get("Ready") == "True" else "NotReady",
-                            "roles": [label.split("/")[1] for label in node.metadata.labels.keys() if "node-role.kubernetes.io" in label] or ["<none>"],
-                            "version": node.status.node_info.kubelet_version,
-                            "internal_ip": next((addr.address for addr in node.status.addresses if addr.type == "InternalIP"), "")
-                        })
-            
-            elif resource_type in ["namespace", "namespaces", "ns"]:
-                if name:
-                    ns = v1.read_namespace(name=name)
-                    result.append({
-                        "name": ns.metadata.name,
-                        "status": ns.status.phase,
-                        "age": str(ns.metadata.creation_timestamp)
-                    })
-                else:
-                    namespaces = v1.list_namespace()
-                    for ns in namespaces.items:
-                        result.append({
-                            "name": ns.metadata.name,
-                            "status": ns.status.phase,
-                            "age": str(ns.metadata.creation_timestamp)
-                        })
-            
-            else:
-                return [types.TextContent(type="text", text=f"Unsupported resource type: {resource_type}")]
-            
-            return [types.TextContent(type="text", text=json.dumps(result, indent=2, default=str))]
-        
-        except Exception as e:
-            return [types.TextContent(type="text", text=f"Error getting resource: {str(e)}")]
-    
-    if name == "kubectl_describe":
-        resource_type = arguments.get("resource_type")
-        if not resource_type:
-            return [types.TextContent(type="text", text="Error: resource_type is required")]
-        
-        name_arg = arguments.get("name")
-        if not name_arg:
-            return [types.TextContent(type="text", text="Error: name is required")]
-        
-        resource_type = resource_type.lower()
-        namespace = arguments.get("namespace", "default")
-        
         try:
-            description = {}
-            
-            if resource_type in ["pod", "pods"]:
-                pod = v1.read_namespaced_pod(name=name_arg, namespace=namespace)
-                description = {
-                    "name": pod.metadata.name,
-                    "namespace": pod.metadata.namespace,
-                    "labels": pod.metadata.labels,
-                    "annotations": pod.metadata.annotations,
-                    "status": pod.status.phase,
-                    "ip": pod.status.pod_ip,
-                    "node": pod.spec.node_name,
-                    "containers": [
-                        {
-                            "name": c.name,
-                            "image": c.image,
-                            "ready": cs.ready if cs else False,
-                            "restart_count": cs.restart_count if cs else 0,
-                            "state": str(cs.state) if cs else "unknown"
-                        }
-                        for c, cs in zip(
-                            pod.spec.containers,
-                            pod.status.container_statuses or [None] * len(pod.spec.containers)
-                        )
-                    ],
-                    "conditions": [{"type": c.type, "status": c.status, "reason": c.reason} for c in (pod.status.conditions or [])],
-                    "events": "Use kubectl get events for pod events"
-                }
-            
-            elif resource_type in ["deployment", "deployments"]:
-                dep = apps_v1.read_namespaced_deployment(name=name_arg, namespace=namespace)
-                description = {
-                    "name": dep.metadata.name,
-                    "namespace": dep.metadata.namespace,
-                    "labels": dep.metadata.labels,
-                    "annotations": dep.metadata.annotations,
-                    "replicas": dep.spec.replicas,
-                    "ready_replicas": dep.status.ready_replicas or 0,
-                    "available_replicas": dep.status.available_replicas or 0,
-                    "updated_replicas": dep.status.updated_replicas or 0,
-                    "selector": dep.spec.selector.match_labels,
-                    "strategy": dep.spec.strategy.type,
-                    "conditions": [{"type": c.type, "status": c.status, "reason": c.reason} for c in (dep.status.conditions or [])]
-                }
-            
-            elif resource_type in ["service", "services", "svc"]:
-                svc = v1.read_namespaced_service(name=name_arg, namespace=namespace)
-                description = {
-                    "name": svc.metadata.name,
-                    "namespace": svc.metadata.namespace,
-                    "labels": svc.metadata.labels,
-                    "annotations": svc.metadata.annotations,
-                    "type": svc.spec.type,
-                    "cluster_ip": svc.spec.cluster_ip,
-                    "external_ips": svc.spec.external_i_ps,
-                    "ports": [{"port": p.port, "protocol": p.protocol, "target_port": str(p.target_port)} for p in (svc.spec.ports or [])],
-                    "selector": svc.spec.selector
-                }
-            
-            elif resource_type in ["node", "nodes"]:
-                node = v1.read_node(name=name_arg)
-                description = {
-                    "name": node.metadata.name,
-                    "labels": node.metadata.labels,
-                    "annotations": node.metadata.annotations,
-                    "capacity": node.status.capacity,
-                    "allocatable": node.status.allocatable,
-                    "conditions": [{"type": c.type, "status": c.status, "reason": c.reason} for c in (node.status.conditions or [])],
-                    "addresses": [{"type": a.type, "address": a.address} for a in (node.status.addresses or [])],
-                    "node_info": {
-                        "kubelet_version": node.status.node_info.kubelet_version,
-                        "os_image": node.status.node_info.os_image,
-                        "container_runtime": node.status.node_info.container_runtime_version
-                    }
-                }
-            
+            # kubernetes_asyncio's create_from_yaml only reads files, so create each document and
+            # collect failures the same way it does
+            failures = []
+            for doc in docs:
+                if doc is None:
+                    continue
+                try:
+                    await utils.create_from_dict(api_client, doc, namespace=namespace)
+                except utils.FailToCreateError as failure:
+                    failures.extend(failure.api_exceptions)
+            if failures:
+                raise utils.FailToCreateError(failures)
+        finally:
+            _invalidate_cache(*{(doc or {}).get("metadata", {}).get("namespace") or namespace or "default" for doc in docs})
+
+        resource_name = docs[0].get("metadata", {}).get("name", "unknown")
+        resource_kind = docs[0].get("kind", "unknown")
+
+        return [types.TextContent(
+            type="text",
+            text=f"Successfully applied {resource_kind}/{resource_name}"
+        )]
+    except Exception as e:
+        return [types.TextContent(type="text", text=f"Error applying manifest: {str(e)}")]
+
+# Every accepted resource type spelling (including kubectl short names) -> canonical name
+_ALIASES = {
+    "po": "pod", "pod": "pod", "pods": "pod",
+    "deploy": "deployment", "deployment": "deployment", "deployments": "deployment",
+    "svc": "service", "service": "service", "services": "service",
+    "no": "node", "node": "node", "nodes": "node",
+    "ns": "namespace", "namespace": "namespace", "namespaces": "namespace"
+}
+
+def _raw(fn):
+    """
+    Wrap a read_*/list_* API function to return the parsed JSON body instead of model objects
+    """
+    async def call(**kwargs):
+        resp = await fn(_preload_content=False, **kwargs)
+        return await _read_json(resp)
+    call.__name__ = fn.__name__ # Read cache key, shared by kubectl_get and kubectl_describe
+    return call
+
+# Rows returned by kubectl_get; slotted dataclasses are smaller than one dict per item and
+# are encoded directly by orjson
+@dataclasses.dataclass(slots=True)
+class PodRow:
+    name: str
+    namespace: str
+    status: str | None
+    ready: str
+    restarts: int
+    node: str | None
+
+@dataclasses.dataclass(slots=True)
+class DeploymentRow:
+    name: str
+    namespace: str
+    ready: str
+    up_to_date: int
+    available: int
+
+@dataclasses.dataclass(slots=True)
+class ServiceRow:
+    name: str
+    namespace: str
+    type: str | None
+    cluster_ip: str | None
+    external_ip: list | str
+    ports: list
+
+@dataclasses.dataclass(slots=True)
+class NodeRow:
+    name: str
+    status: str
+    roles: list
+    version: str | None
+    internal_ip: str
+
+@dataclasses.dataclass(slots=True)
+class NamespaceRow:
+    name: str
+    status: str | None
+    age: str | None
+
+# Projections work on the raw API JSON (camelCase keys), see _raw()
+def _project_pod(pod, namespace):
+    status = pod.get("status", {})
+    # Single pass over the container statuses for all three counters
+    ready = total = restarts = 0
+    for c in status.get("containerStatuses") or ():
+        total += 1
+        ready += bool(c.get("ready"))
+        restarts += c.get("restartCount", 0)
+    return PodRow(
+        name=pod["metadata"]["name"],
+        namespace=namespace,
+        status=status.get("phase"),
+        ready=f"{ready}/{total}",
+        restarts=restarts,
+        node=pod.get("spec", {}).get("nodeName")
+    )
+
+def _project_deployment(dep, namespace):
+    status = dep.get("status", {})
+    return DeploymentRow(
+        name=dep["metadata"]["name"],
+        namespace=namespace,
+        ready=f"{status.get('readyReplicas', 0)}/{dep['spec'].get('replicas')}",
+        up_to_date=status.get("updatedReplicas", 0),
+        available=status.get("availableReplicas", 0)
+    )
+
+def _project_service(svc, namespace):
+    spec = svc["spec"]
+    return ServiceRow(
+        name=svc["metadata"]["name"],
+        namespace=namespace,
+        type=spec.get("type"),
+        cluster_ip=spec.get("clusterIP"),
+        external_ip=spec.get("externalIPs") or "none",
+        ports=[f"{p.get('port')}/{p.get('protocol')}" for p in (spec.get("ports") or [])]
+    )
+
+_ROLE_PREFIX = "node-role.kubernetes.io/"
+
+def _project_node(node):
+    status = node.get("status", {})
+    conditions = {c["type"]: c["status"] for c in status.get("conditions") or []}
+    # Reversed so the first address of each type wins, as with dual-stack nodes listing two InternalIPs
+    addresses = {a["type"]: a["address"] for a in reversed(status.get("addresses") or [])}
+    return NodeRow(
+        name=node["metadata"]["name"],
+        status="Ready" if conditions.get("Ready") == "True" else "NotReady",
+        roles=[k[len(_ROLE_PREFIX):] for k in node["metadata"].get("labels") or {} if k.startswith(_ROLE_PREFIX)] or ["<none>"],
+        version=status.get("nodeInfo", {}).get("kubeletVersion"),
+        internal_ip=addresses.get("InternalIP", "")
+    )
+
+def _project_namespace(ns):
+    return NamespaceRow(
+        name=ns["metadata"]["name"],
+        status=ns.get("status", {}).get("phase"),
+        age=ns["metadata"].get("creationTimestamp")
+    )
+
+# Canonical resource type -> (read_fn, list_fn, project_fn, list_path), filled by _build_get_tables() once the API clients exist
+_GET_TABLE = {} # Namespaced resources, called with a namespace
+_CLUSTER_GET_TABLE = {} # Cluster-scoped resources, called without one
+
+def _build_get_tables():
+    pod = (_cached(_raw(v1.read_namespaced_pod)), _raw(v1.list_namespaced_pod), _project_pod, "/api/v1/namespaces/{namespace}/pods")
+    deployment = (_cached(_raw(apps_v1.read_namespaced_deployment)), _raw(apps_v1.list_namespaced_deployment), _project_deployment, "/apis/apps/v1/namespaces/{namespace}/deployments")
+    service = (_cached(_raw(v1.read_namespaced_service)), _raw(v1.list_namespaced_service), _project_service, "/api/v1/namespaces/{namespace}/services")
+    node = (_cached(_raw(v1.read_node)), _raw(v1.list_node), _project_node, "/api/v1/nodes")
+    namespace = (_cached(_raw(v1.read_namespace)), _raw(v1.list_namespace), _project_namespace, "/api/v1/namespaces")
+
+    _GET_TABLE.update({"pod": pod, "deployment": deployment, "service": service})
+    _CLUSTER_GET_TABLE.update({"node": node, "namespace": namespace})
+
+# Ask the API server for metadata only (no spec/status) when the caller just wants names
+_PARTIAL_METADATA_ACCEPT = "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1"
+_SELECTOR_QUERY_PARAMS = {"label_selector": "labelSelector", "field_selector": "fieldSelector"}
+LIST_PAGE_SIZE = 500 # Items per list request, so only one page of raw JSON is alive at a time
+
+async def _list_names(list_path: str, namespace: str | None = None, **selectors):
+    """
+    List resource names through the raw API, skipping model deserialization
+    """
+    path_params = {"namespace": namespace} if namespace is not None else {}
+    query_params = [(_SELECTOR_QUERY_PARAMS[k], v) for k, v in selectors.items()]
+    query_params.append(("limit", LIST_PAGE_SIZE))
+    names = []
+    token = None
+    while True:
+        resp = await api_client.call_api(
+            list_path,
+            "GET",
+            path_params=path_params,
+            query_params=query_params + ([("continue", token)] if token else []),
+            header_params={"Accept": _PARTIAL_METADATA_ACCEPT},
+            auth_settings=["BearerToken"],
+            _return_http_data_only=True,
+            _preload_content=False
+        )
+        raw = await _read_json(resp)
+        names.extend(item["metadata"]["name"] for item in raw.get("items", []))
+        token = raw.get("metadata", {}).get("continue")
+        if not token:
+            return names
+
+async def _list_projected(list_fn, project, **kwargs):
+    """
+    Page through a list_* call, projecting each page before fetching the next one.
+    Pages are fetched uncached; callers cache the projected rows instead.
+    """
+    row = functools.partial(project, namespace=kwargs["namespace"]) if "namespace" in kwargs else project
+    result = []
+    token = None
+    while True:
+        page = await list_fn(limit=LIST_PAGE_SIZE, _continue=token, **kwargs)
+        result.extend(row(item) for item in page["items"])
+        token = page["metadata"].get("continue")
+        if not token:
+            return result
+
+async def _handle_get(arguments: dict):
+    resource_type = arguments.get("resource_type")
+    if not resource_type:
+        return [types.TextContent(type="text", text="Error: resource_type is required")]
+
+    resource_type = resource_type.lower()
+    namespace = arguments.get("namespace", "default")
+    name = arguments.get("name")
+    names_only = arguments.get("names_only", False)
+    selectors = {k: arguments[k] for k in _SELECTOR_QUERY_PARAMS if arguments.get(k)}
+    if name and (names_only or selectors):
+        return [types.TextContent(type="text", text="Error: names_only, label_selector and field_selector cannot be combined with name")]
+
+    try:
+        canonical = _ALIASES.get(resource_type)
+        if canonical in _GET_TABLE:
+            read_fn, list_fn, project, list_path = _GET_TABLE[canonical]
+            if name:
+                result = [project(await read_fn(name=name, namespace=namespace), namespace)]
+            elif names_only:
+                names = await _cached_call(_list_names, list_path=list_path, namespace=namespace, **selectors)
+                result = [{"name": n, "namespace": namespace} for n in names]
             else:
-                return [types.TextContent(type="text", text=f"Unsupported resource type: {resource_type}")]
-            
-            return [types.TextContent(type="text", text=json.dumps(description, indent=2, default=str))]
-        
-        except Exception as e:
-            return [types.TextContent(type="text", text=f"Error describing resource: {str(e)}")]
-    
-    if name == "kubectl_delete":
-        yaml_content = arguments.get("yaml_content")
-        if not yaml_content:
-            return [types.TextContent(type="text", text="Error: yaml_content is required")]
-        
-        namespace = arguments.get("namespace")
-        
-        try:
-            
-            manifest = yaml.safe_load(yaml_content)
-            
-            if not manifest:
-                return [types.TextContent(type="text", text="Error: Invalid YAML content")]
-            
-            resource_name = manifest.get("metadata", {}).get("name")
-            if not resource_name:
-                return [types.TextContent(type="text", text="Error: Resource name not found in YAML")]
-            
-            resource_kind = manifest.get("kind", "").lower()
-            if not resource_kind:
-                return [types.TextContent(type="text", text="Error: Resource kind not found in YAML")]
-            
-            resource_namespace = namespace or manifest.get("metadata", {}).get("namespace", "default")
-            
-            if resource_kind == "pod":
-                v1.delete_namespaced_pod(name=resource_name, namespace=resource_namespace)
-            elif resource_kind == "deployment":
-                apps_v1.delete_namespaced_deployment(name=resource_name, namespace=resource_namespace)
-            elif resource_kind == "service":
-                v1.delete_namespaced_service(name=resource_name, namespace=resource_namespace)
+                result = await _cached_call(_list_projected, list_fn=list_fn, project=project, namespace=namespace, **selectors)
+
+        elif canonical in _CLUSTER_GET_TABLE:
+            read_fn, list_fn, project, list_path = _CLUSTER_GET_TABLE[canonical]
+            if name:
+                result = [project(await read_fn(name=name))]
+            elif names_only:
+                result = [{"name": n} for n in await _cached_call(_list_names, list_path=list_path, **selectors)]
             else:
-                return [types.TextContent(type="text", text=f"Generic deletion not fully implemented for {resource_kind}")]
-            
-            return [types.TextContent(
-                type="text",
-                text=f"Successfully deleted {resource_kind}/{resource_name} from namespace {resource_namespace}"
-            )]
-        
-        except Exception as e:
-            return [types.TextContent(type="text", text=f"Error deleting resource: {str(e)}")]
-    
-    raise ValueError(f"Unknown tool: {name}")
+                result = await _cached_call(_list_projected, list_fn=list_fn, project=project, **selectors)
+
+        else:
+            return [types.TextContent(type="text", text=f"Unsupported resource type: {resource_type}")]
+
+        return [types.TextContent(type="text", text=_dumps(result))]
+
+    except Exception as e:
+        return [types.TextContent(type="text", text=f"Error getting resource: {str(e)}")]
+
+async def _handle_describe(arguments: dict):
+    resource_type = arguments.get("resource_type")
+    if not resource_type:
+        return [types.TextContent(type="text", text="Error: resource_type is required")]
+
+    name_arg = arguments.get("name")
+    if not name_arg:
+        return [types.TextContent(type="text", text="Error: name is required")]
+
+    resource_type = resource_type.lower()
+    namespace = arguments.get("namespace", "default")
+
+    try:
+        description = {}
+
+        # Main objects are read through the kubectl_get tables, so a describe right after a get hits the read cache
+        canonical = _ALIASES.get(resource_type)
+        if canonical == "pod":
+            # Pod and its events are independent reads, fetch them concurrently
+            pod, events = await asyncio.gather(
+                _GET_TABLE["pod"][0](name=name_arg, namespace=namespace),
+                _cached_call(
+                    _raw(v1.list_namespaced_event),
+                    namespace=namespace,
+                    field_selector=f"involvedObject.kind=Pod,involvedObject.name={name_arg}"
+                )
+            )
+            meta, spec, status = pod["metadata"], pod.get("spec", {}), pod.get("status", {})
+            container_statuses = {cs["name"]: cs for cs in status.get("containerStatuses") or []}
+            containers = []
+            for c in spec.get("containers") or []:
+                cs = container_statuses.get(c["name"]) or {}
+                containers.append({
+                    "name": c["name"],
+                    "image": c.get("image"),
+                    "ready": cs.get("ready", False),
+                    "restart_count": cs.get("restartCount", 0),
+                    "state": cs.get("state", "unknown")
+                })
+            description = {
+                "name": meta.get("name"),
+                "namespace": meta.get("namespace"),
+                "labels": meta.get("labels"),
+                "annotations": meta.get("annotations"),
+                "status": status.get("phase"),
+                "ip": status.get("podIP"),
+                "node": spec.get("nodeName"),
+                "containers": containers,
+                "conditions": [{"type": c.get("type"), "status": c.get("status"), "reason": c.get("reason")} for c in (status.get("conditions") or [])],
+                "events": [
+                    {"type": e.get("type"), "reason": e.get("reason"), "message": e.get("message"), "count": e.get("count"), "last_seen": e.get("lastTimestamp")}
+                    for e in events["items"]
+                ]
+            }
+
+        elif canonical == "deployment":
+            dep, replica_sets = await asyncio.gather(
+                _GET_TABLE["deployment"][0](name=name_arg, namespace=namespace),
+                _cached_call(_raw(apps_v1.list_namespaced_replica_set), namespace=namespace)
+            )
+            meta, spec, status = dep["metadata"], dep.get("spec", {}), dep.get("status", {})
+            dep_uid = meta.get("uid")
+            description = {
+                "name": meta.get("name"),
+                "namespace": meta.get("namespace"),
+                "labels": meta.get("labels"),
+                "annotations": meta.get("annotations"),
+                "replicas": spec.get("replicas"),
+                "ready_replicas": status.get("readyReplicas", 0),
+                "available_replicas": status.get("availableReplicas", 0),
+                "updated_replicas": status.get("updatedReplicas", 0),
+                "selector": spec.get("selector", {}).get("matchLabels"),
+                "strategy": spec.get("strategy", {}).get("type"),
+                "conditions": [{"type": c.get("type"), "status": c.get("status"), "reason": c.get("reason")} for c in (status.get("conditions") or [])],
+                "replica_sets": [
+                    {"name": rs["metadata"]["name"], "replicas": rs.get("spec", {}).get("replicas"), "ready_replicas": rs.get("status", {}).get("readyReplicas", 0)}
+                    for rs in replica_sets["items"]
+                    if any(o.get("kind") == "Deployment" and o.get("uid") == dep_uid for o in (rs["metadata"].get("ownerReferences") or []))
+                ]
+            }
+
+        elif canonical == "service":
+            # Services without a selector have no Endpoints object, so a 404 for it is not an error
+            svc, endpoints = await asyncio.gather(
+                _GET_TABLE["service"][0](name=name_arg, namespace=namespace),
+                _cached_call(_raw(v1.read_namespaced_endpoints), name=name_arg, namespace=namespace),
+                return_exceptions=True
+            )
+            if isinstance(svc, Exception):
+                raise svc
+            if isinstance(endpoints, Exception):
+                if not (isinstance(endpoints, client.ApiException) and endpoints.status == 404):
+                    raise endpoints
+                endpoints = None
+            meta, spec = svc["metadata"], svc.get("spec", {})
+            description = {
+                "name": meta.get("name"),
+                "namespace": meta.get("namespace"),
+                "labels": meta.get("labels"),
+                "annotations": meta.get("annotations"),
+                "type": spec.get("type"),
+                "cluster_ip": spec.get("clusterIP"),
+                "external_ips": spec.get("externalIPs"),
+                "ports": [{"port": p.get("port"), "protocol": p.get("protocol"), "target_port": str(p.get("targetPort"))} for p in (spec.get("ports") or [])],
+                "selector": spec.get("selector"),
+                "endpoints": [
+                    f"{a.get('ip')}:{p.get('port')}"
+                    for subset in (endpoints.get("subsets") or [])
+                    for a in (subset.get("addresses") or [])
+                    for p in (subset.get("ports") or [])
+                ] if endpoints is not None else []
+            }
+
+        elif canonical == "node":
+            node = await _CLUSTER_GET_TABLE["node"][0](name=name_arg)
+            meta, status = node["metadata"], node.get("status", {})
+            node_info = status.get("nodeInfo", {})
+            description = {
+                "name": meta.get("name"),
+                "labels": meta.get("labels"),
+                "annotations": meta.get("annotations"),
+                "capacity": status.get("capacity"),
+                "allocatable": status.get("allocatable"),
+                "conditions": [{"type": c.get("type"), "status": c.get("status"), "reason": c.get("reason")} for c in (status.get("conditions") or [])],
+                "addresses": [{"type": a.get("type"), "address": a.get("address")} for a in (status.get("addresses") or [])],
+                "node_info": {
+                    "kubelet_version": node_info.get("kubeletVersion"),
+                    "os_image": node_info.get("osImage"),
+                    "container_runtime": node_info.get("containerRuntimeVersion")
+                }
+            }
+
+        else:
+            return [types.TextContent(type="text", text=f"Unsupported resource type: {resource_type}")]
+
+        return [types.TextContent(type="text", text=_dumps(description))]
+
+    except Exception as e:
+        return [types.TextContent(type="text", text=f"Error describing resource: {str(e)}")]
+
+async def _handle_delete(arguments: dict):
+    yaml_content = arguments.get("yaml_content")
+    if not yaml_content:
+        return [types.TextContent(type="text", text="Error: yaml_content is required")]
+
+    namespace = arguments.get("namespace")
+
+    try:
+
+        docs = await _parse_yaml(yaml_content)
+        if len(docs) > 1:
+            return [types.TextContent(type="text", text="Error: expected a single YAML document")]
+        manifest = docs[0] if docs else None
+
+        if not manifest:
+            return [types.TextContent(type="text", text="Error: Invalid YAML content")]
+
+        resource_name = manifest.get("metadata", {}).get("name")
+        if not resource_name:
+            return [types.TextContent(type="text", text="Error: Resource name not found in YAML")]
+
+        kind = manifest.get("kind", "")
+        if not kind:
+            return [types.TextContent(type="text", text="Error: Resource kind not found in YAML")]
+        resource_kind = kind.lower()
+
+        api_version = manifest.get("apiVersion")
+        if not api_version:
+            return [types.TextContent(type="text", text="Error: Resource apiVersion not found in YAML")]
+
+        # Discovery results are cached by the dynamic client, so after the first call this is a dict lookup
+        resource = await (await get_dyn_client()).resources.get(api_version=api_version, kind=kind)
+
+        if not resource.namespaced:
+            await resource.delete(name=resource_name)
+            _invalidate_cache()
+            return [types.TextContent(type="text", text=f"Successfully deleted {resource_kind}/{resource_name}")]
+
+        resource_namespace = namespace or manifest.get("metadata", {}).get("namespace", "default")
+        await resource.delete(name=resource_name, namespace=resource_namespace)
+        _invalidate_cache(resource_namespace)
+
+        return [types.TextContent(
+            type="text",
+            text=f"Successfully deleted {resource_kind}/{resource_name} from namespace {resource_namespace}"
+        )]
+
+    except Exception as e:
+        return [types.TextContent(type="text", text=f"Error deleting resource: {str(e)}")]
+
+# Tool name -> handler, built once so dispatch is a single dict lookup
+_DISPATCH = {
+    "kubectl_apply": _handle_apply,
+    "kubectl_get": _handle_get,
+    "kubectl_describe": _handle_describe,
+    "kubectl_delete": _handle_delete
+}
+
+@server.call_tool()
+async def call_tool(name: str, arguments: dict):
+    handler = _DISPATCH.get(name)
+    if handler is None:
+        raise ValueError(f"Unknown tool: {name}")
+    return await handler(arguments)
 
 # -----------------------------
 # STDIO SERVER RUNNER
 # -----------------------------
 async def main():
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream=read_stream,
-            write_stream=write_stream,
-            initialization_options=InitializationOptions(
-                server_name="k8s-mcp-server",
-                server_version="1.0.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={}
+    await init()
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream=read_stream,
+                write_stream=write_stream,
+                initialization_options=InitializationOptions(
+                    server_name="k8s-mcp-server",
+                    server_version="1.0.0",
+                    capabilities=server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={}
+                    )
                 )
             )
-        )
+    finally:
+        await api_client.close()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file